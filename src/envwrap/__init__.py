@@ -26,10 +26,14 @@ SOFTWARE.
 from __future__ import annotations
 
 import inspect
+import linecache
 import os
-from functools import wraps
-from inspect import signature
-from typing import Optional, Dict, Callable
+import sys
+from contextlib import suppress
+from functools import partial
+from functools import update_wrapper
+from typing import Optional, Dict, Callable, List, Tuple, get_type_hints
+from weakref import WeakKeyDictionary
 
 from typing_extensions import ParamSpec, TypeVar, Any, cast
 
@@ -50,45 +54,297 @@ def get_root_function(func: F) -> F:
     callable
         The root method of the given method or function.
     """
-    while hasattr(func, "__func__"):
+    while hasattr(func, "__func__"):  # bound methods, classmethod & staticmethod
         func = func.__func__
-    return func
+    try:  # `functools.wraps`-style decorators
+        return cast(F, inspect.unwrap(func))
+    except ValueError:  # cycle in the `__wrapped__` chain
+        return func
+
+
+_SIG_CACHE: "WeakKeyDictionary[Callable[..., Any], inspect.Signature]" = WeakKeyDictionary()
+
+
+def _cached_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """
+    Get the signature of a callable, parsing it only once per callable.
+
+    Parameters
+    ----------
+    func : callable
+        The callable to get the signature of.
+
+    Returns
+    -------
+    inspect.Signature
+        The signature of the given callable.
+    """
+    try:
+        return _SIG_CACHE[func]
+    except KeyError:
+        sig = _SIG_CACHE[func] = inspect.signature(func)
+    except TypeError:  # not weak-referenceable (e.g. builtins), don't cache
+        sig = inspect.signature(func)
+    return sig
 
 
 def is_likely_method(func: Callable[..., Any]) -> bool:
     # Check if the first parameter is named 'self' or 'cls'
-    params = inspect.signature(func).parameters
+    params = _cached_signature(func).parameters
     if not params:
         return False
     first_param = next(iter(params.values()))
     return first_param.name in ("self", "cls")
 
 
+def _identity(value: str) -> str:
+    return value
+
+
+# converted values of these types are safe to reuse across calls
+_IMMUTABLE_TYPES = frozenset((bool, int, float, complex, str, bytes, type(None)))
+
+
+def _is_shareable(overrides: Dict[str, Any]) -> bool:
+    return all(type(v) in _IMMUTABLE_TYPES for v in overrides.values())
+
+
+def _to_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("1", "true", "yes", "on"):
+        return True
+    if lowered in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"invalid truth value {value!r}")
+
+
+# types whose constructor doesn't parse a string the way an env var means it
+_FAST_CONVERTERS: Dict[Any, Callable[[str], Any]] = {
+    bool: _to_bool,  # bool("False") is True
+    bytes: str.encode,  # bytes("abc") needs an encoding
+}
+
+
+def _convert_with(typs: Tuple[Callable[[str], Any], ...]) -> Callable[[str], Any]:
+    """
+    Build a converter that tries each of the given types in order.
+
+    Parameters
+    ----------
+    typs : tuple of callable
+        The candidate types, e.g. the `__args__` of a `Union` annotation.
+
+    Returns
+    -------
+    callable
+        A converter returning the first successful conversion, or the
+        unconverted value if every type fails.
+    """
+
+    typs = tuple(_FAST_CONVERTERS.get(typ, typ) for typ in typs)
+
+    if len(typs) == 1:  # plain annotation, no loop needed
+        (typ,) = typs
+
+        def convert_one(value: str) -> Any:
+            try:
+                return typ(value)
+            except Exception:
+                return value
+
+        return convert_one
+
+    def convert(value: str) -> Any:
+        for typ in typs:
+            try:
+                return typ(value)
+            except Exception:
+                pass
+        return value
+
+    return convert
+
+
+def _resolve_converter(
+    param: inspect.Parameter,
+    hints: Dict[str, Any],
+    types: Dict[str, Callable[[str], Any]],
+) -> Callable[[str], Any]:
+    """
+    Pick the converter used for the env var of a single parameter.
+
+    Parameters
+    ----------
+    param : inspect.Parameter
+        The parameter the env var overrides.
+    hints : dict
+        The resolved string annotations of the wrapped callable.
+    types : dict
+        The `types` fallback mapping passed to `envwrap`.
+
+    Returns
+    -------
+    callable
+        The converter for the parameter's env var.
+    """
+    annotation = param.annotation
+    if isinstance(annotation, str):  # only string annotations need resolving
+        annotation = hints.get(param.name, annotation)
+    if annotation is not param.empty and not isinstance(annotation, str):  # typehints
+        return _convert_with(getattr(annotation, "__args__", (annotation,)))
+    typ: Callable[[str], Any]
+    if param.default is not None:  # type of default value
+        typ = type(param.default)
+    else:
+        try:  # `types` fallback, indexed so a `defaultdict` can supply its factory
+            typ = types[param.name]
+        except KeyError:  # keep unconverted (`str`)
+            return _identity
+    return _FAST_CONVERTERS.get(typ, typ)
+
+
+def _resolve_hints(func: Callable[..., Any]) -> Dict[str, Any]:
+    """
+    Resolve the string annotations of a callable, e.g. `from __future__ import annotations`.
+
+    Parameters
+    ----------
+    func : callable
+        The callable whose parameter annotations to resolve.
+
+    Returns
+    -------
+    dict
+        The resolved annotations. If `typing.get_type_hints` fails, each string
+        annotation is evaluated on its own and any that still fail stay strings.
+    """
+    # the function whose parameters `inspect.signature` reports, not e.g. a class body
+    while isinstance(func, partial):
+        func = func.func
+    if inspect.isclass(func):
+        func = func.__init__
+    elif not inspect.isroutine(func):  # callable instance
+        func = type(func).__call__
+
+    try:
+        return get_type_hints(func)
+    except Exception:  # one unresolvable forward reference fails them all
+        annotations = getattr(func, "__annotations__", {})
+
+    globalns = getattr(inspect.unwrap(func), "__globals__", {})
+    hints = {}
+    for name, annotation in annotations.items():
+        if isinstance(annotation, str):
+            # left as a string if unresolvable, so the default value's type is used instead
+            with suppress(Exception):
+                annotation = eval(annotation, globalns)  # nosec B307
+        hints[name] = annotation
+    return hints
+
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
+_CALL_TEMPLATE = """\
+def final_callable(*args, **kwargs):
+    get = _os.environ.get
+    snapshot = ({lookups})
+    state = _cache[0]
+    if snapshot != state[0]:
+        state = _cache[0] = _refresh(snapshot)
+    overrides = state[1]
+    if overrides is None:  # mutable values are never shared between calls
+        overrides = _convert(snapshot)
+    if not overrides:  # nothing set, the signature's own defaults apply
+        return _func(*args, **kwargs)
+    # defaults for anything not overridden are applied by `_func` itself
+    if not args:
+        return _func(**{{**overrides, **kwargs}})
+    # arguments passed positionally take precedence over the environment
+    bound = _positional[:len(args)]
+    overrides = {{k: v for k, v in overrides.items() if k not in bound}}
+    return _func(*args, **{{**overrides, **kwargs}})
+"""
+
+
+def _specialize(
+    func: Callable[P, R],
+    env_keys: List[str],
+    positional: Tuple[str, ...],
+    convert: Callable[[Tuple[Optional[str], ...]], Dict[str, Any]],
+    refresh: Callable[[Tuple[Optional[str], ...]], Tuple[Any, ...]],
+    cache: List[Any],
+) -> Callable[P, R]:
+    """
+    Generate a wrapper with the env var lookups for `func` unrolled.
+
+    Parameters
+    ----------
+    func : callable
+        The function to wrap.
+    env_keys : list of str
+        The env vars to read on every call, in parameter order.
+    positional : tuple of str
+        The names of the parameters that can be passed positionally, in order.
+    convert : callable
+        Converts a snapshot of the env var values into overrides.
+    refresh : callable
+        Builds the cache entry for a new snapshot of the env var values.
+    cache : list
+        A single slot holding the last `(snapshot, overrides)` entry, where
+        `overrides` is None if it can't be shared between calls.
+
+    Returns
+    -------
+    callable
+        The wrapper, not yet carrying any of `func`'s metadata.
+    """
+    namespace: Dict[str, Any] = {
+        "_os": os,
+        "_func": func,
+        "_positional": positional,
+        "_convert": convert,
+        "_refresh": refresh,
+        "_cache": cache,
+    }
+    lookups = []
+    for i, env_key in enumerate(env_keys):
+        namespace[f"_key{i}"] = env_key  # keys go through the namespace, never the source
+        lookups.append(f"get(_key{i}),")
+    source = _CALL_TEMPLATE.format(lookups=" ".join(lookups))
+    # a distinct filename per wrapper, registered so tracebacks and pdb can show the source
+    filename = f"<envwrap {getattr(func, '__qualname__', type(func).__qualname__)}-{id(func):x}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), namespace)  # nosec B102
+    return cast(Callable[P, R], namespace["final_callable"])
+
 
 def envwrap(
     prefix: str,
-    types: Optional[Dict[str, type]] = None,
+    types: Optional[Dict[str, Callable[[str], Any]]] = None,
     is_method: Optional[bool] = None,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
     Override parameter defaults via `os.environ[prefix + param_name]`.
     Maps UPPER_CASE env vars map to lower_case param names.
+    Only the exact `prefix + PARAM_NAME.upper()` env var is read, so `FOO_a` is ignored.
     camelCase isn't supported (because Windows ignores case).
 
     Precedence (highest first):
 
-    - call (`foo(a=3)`)
+    - call (`foo(a=3)` or `foo(3)`)
     - environ (`FOO_A=2`)
     - signature (`def foo(a=1)`)
 
     Types are handled by typehints and are automatically determined, if possible.
     The types argument can be used to override the typehint inference.
     Envwrap will fallback to str if no typehint, override, or default value is found.
+    `bool` parameters accept 1/0, true/false, yes/no and on/off (case-insensitive).
+    Converted values are reused until the env vars change, unless any of them is
+    mutable (e.g. a list from `ast.literal_eval`), which is converted afresh per call.
 
-    `from __future__ import annotations` annotations are not supported.
+    String annotations (`from __future__ import annotations`) are resolved once
+    at decoration time; any that can't be resolved are ignored individually.
 
     Parameters
     ----------
@@ -119,47 +375,47 @@ def envwrap(
         types = {}
 
     def wrapper(func: Callable[P, R]) -> Callable[P, R]:
-        params = signature(func).parameters
+        params_signature = _cached_signature(func)
+        params = params_signature.parameters
         root_function = get_root_function(func)
 
         is_method_explicit = is_method or is_likely_method(root_function)
 
         # if we are wrapping a method, we need to skip the first parameter
-        params_method_safe = list(params.keys())[1:] if is_method_explicit else list(params.keys())
+        params_method_safe = tuple(params)[1:] if is_method_explicit else tuple(params)
+
+        hints = _resolve_hints(func)
 
-        if not callable(func):
-            raise TypeError(f"{func} is not callable")
+        # resolve how each parameter is converted once, at decoration time
+        converters = {k: _resolve_converter(params[k], hints, types) for k in params_method_safe}
 
-        @wraps(func)
-        def final_callable(*args: P.args, **kwargs: P.kwargs) -> R:
-            env_overrides = {
-                k[len(prefix) :].lower(): v for k, v in os.environ.items() if k.startswith(prefix)
+        env_keys = tuple((k, sys.intern(prefix + k.upper())) for k in params_method_safe)
+
+        def convert(snapshot: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+            return {
+                k: converters[k](v)
+                for (k, _), v in zip(env_keys, snapshot)  # noqa: B905
+                if v is not None
             }
-            overrides = {k: v for k, v in env_overrides.items() if k in params_method_safe}
-
-            for k in overrides:
-                param = params[k]
-                if param.annotation is not param.empty:  # typehints
-                    for typ in getattr(param.annotation, "__args__", (param.annotation,)):
-                        try:
-                            overrides[k] = typ(overrides[k])
-                        except Exception:
-                            pass
-                        else:
-                            break
-                elif param.default is not None:  # type of default value
-                    overrides[k] = type(param.default)(overrides[k])
-                else:
-                    try:  # `types` fallback
-                        overrides[k] = types[k](overrides[k])
-                    except KeyError:  # keep unconverted (`str`)
-                        pass
-
-            default_kwargs = {k: v.default for k, v in params.items() if v.default is not v.empty}
-
-            final_kwargs = cast(P.kwargs, {**default_kwargs, **overrides, **kwargs})
-
-            return func(*args, **final_kwargs)
+
+        def refresh(snapshot: Tuple[Optional[str], ...]) -> Tuple[Any, ...]:
+            overrides = convert(snapshot)
+            return snapshot, overrides if _is_shareable(overrides) else None
+
+        # the last snapshot of raw env values and the overrides converted from it,
+        # swapped as one tuple so concurrent callers never see a mismatched pair
+        cache: List[Any] = [(None, None)]
+
+        positional = tuple(
+            k for k, v in params.items() if v.kind in (v.POSITIONAL_ONLY, v.POSITIONAL_OR_KEYWORD)
+        )
+
+        final_callable = _specialize(
+            func, [env_key for _, env_key in env_keys], positional, convert, refresh, cache
+        )
+
+        update_wrapper(final_callable, func)
+        final_callable.__signature__ = params_signature  # type: ignore[attr-defined]
 
         return final_callable
 
@@ -1,8 +1,14 @@
+import ast
+import functools
+import inspect
 import os
-from typing import Any, Dict, Tuple, Union
+import traceback
+from collections import defaultdict
+from typing import Any, Callable, Dict, Tuple, Union, get_type_hints
 
 import pytest
 from envwrap import envwrap
+from envwrap import get_root_function
 
 
 # Helper function to set environment variables
@@ -38,6 +44,89 @@ def test_standalone_function() -> None:
     assert test_func(a=10, c=1.23) == (10, "default", 1.23)
 
 
+def test_positional_call_without_env() -> None:
+    @envwrap("TEST_")
+    def test_func(a: int = 1, b: str = "default") -> Tuple[int, str]:
+        return a, b
+
+    assert test_func(5) == (5, "default")
+    assert test_func(5, "positional") == (5, "positional")
+
+
+def test_positional_call_with_env() -> None:
+    class TestClass:
+        @envwrap("TEST_")
+        def test_method(self, x: int = 1, y: str = "default") -> Tuple[int, str]:
+            return x, y
+
+    set_env_vars({"TEST_X": "99", "TEST_Y": "override"})
+    assert TestClass().test_method(5) == (5, "override")
+    assert TestClass().test_method(5, "positional") == (5, "positional")
+    assert TestClass().test_method(y="call_override") == (99, "call_override")
+    clear_env_vars({"TEST_X": "", "TEST_Y": ""})
+
+
+def test_env_changes_between_calls() -> None:
+    @envwrap("TEST_")
+    def test_func(a: int = 1) -> int:
+        return a
+
+    set_env_vars({"TEST_A": "2"})
+    assert test_func() == 2
+    set_env_vars({"TEST_A": "3"})
+    assert test_func() == 3
+    clear_env_vars({"TEST_A": ""})
+    assert test_func() == 1
+
+
+def test_metadata_preserved() -> None:
+    def test_func(a: int = 1) -> int:
+        """Docstring."""
+        return a
+
+    wrapped = envwrap("TEST_")(test_func)
+
+    assert wrapped.__name__ == "test_func"
+    assert wrapped.__qualname__ == test_func.__qualname__
+    assert wrapped.__doc__ == "Docstring."
+    assert wrapped.__wrapped__ is test_func  # type: ignore[attr-defined]
+    assert get_type_hints(wrapped) == get_type_hints(test_func)
+    assert inspect.signature(wrapped) == inspect.signature(test_func)
+    # the signature computed at decoration time is handed out as-is, not re-parsed
+    assert inspect.signature(wrapped) is inspect.signature(wrapped)
+
+
+def test_partial_and_callable_instance() -> None:
+    def test_func(a: int = 1, b: int = 2) -> Tuple[int, int]:
+        return a, b
+
+    class CallableInstance:
+        def __call__(self, c: int = 3) -> int:
+            return c
+
+    partial = envwrap("TEST_")(functools.partial(test_func, b=0))
+    instance = envwrap("TEST_")(CallableInstance())
+
+    set_env_vars({"TEST_A": "5", "TEST_C": "6"})
+    assert partial() == (5, 0)
+    assert instance() == 6
+    clear_env_vars({"TEST_A": "", "TEST_C": ""})
+
+
+def test_traceback_shows_wrapper_source() -> None:
+    @envwrap("TEST_")
+    def test_func(a: int = 1) -> int:
+        raise ValueError(a)
+
+    with pytest.raises(ValueError) as excinfo:
+        test_func()
+
+    frames = traceback.extract_tb(excinfo.value.__traceback__)
+    wrapper_frames = [frame for frame in frames if frame.filename.startswith("<envwrap")]
+    assert wrapper_frames
+    assert all(frame.line for frame in wrapper_frames)
+
+
 def test_instance_method() -> None:
     class TestClass:
         @envwrap("TEST_")
@@ -74,6 +163,34 @@ def test_class_method() -> None:
     clear_env_vars({"TEST_P": "", "TEST_Q": ""})
 
 
+def test_stacked_decorators() -> None:
+    def passthrough(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def inner(this: Any, *args: Any, **kwargs: Any) -> Any:
+            return func(this, *args, **kwargs)
+
+        # advertise its own first parameter rather than following `__wrapped__`
+        sig = inspect.signature(func)
+        this = inspect.Parameter("this", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        inner.__signature__ = sig.replace(  # type: ignore[attr-defined]
+            parameters=[this, *list(sig.parameters.values())[1:]]
+        )
+        return inner
+
+    def test_method(self: Any, x: int = 1) -> int:
+        return x
+
+    class TestClass:
+        method = envwrap("TEST_")(passthrough(test_method))
+
+    assert get_root_function(TestClass().method) is test_method
+
+    # `this` is only recognized as the instance through the unwrapped `self`
+    set_env_vars({"TEST_THIS": "not_an_instance", "TEST_X": "5"})
+    assert TestClass().method() == 5
+    clear_env_vars({"TEST_THIS": "", "TEST_X": ""})
+
+
 def test_static_method() -> None:
     class TestClass:
         @staticmethod
@@ -104,6 +221,106 @@ def test_type_conversion() -> None:
     clear_env_vars({"TEST_A": "", "TEST_B": "", "TEST_C": ""})
 
 
+def test_defaultdict_types_fallback() -> None:
+    @envwrap("TEST_", types=defaultdict(lambda: ast.literal_eval))
+    def test_func(a=None, b=None):  # type: ignore[no-untyped-def]
+        return a, b
+
+    set_env_vars({"TEST_A": "[1, 2]", "TEST_B": "{'k': 3}"})
+    assert test_func() == ([1, 2], {"k": 3})
+    clear_env_vars({"TEST_A": "", "TEST_B": ""})
+
+
+def test_mutable_overrides_not_shared() -> None:
+    @envwrap("TEST_", types={"a": list})
+    def test_func(a=None):  # type: ignore[no-untyped-def]
+        a.append(1)
+        return a
+
+    set_env_vars({"TEST_A": "xy"})
+    assert test_func() == ["x", "y", 1]
+    assert test_func() == ["x", "y", 1]
+    clear_env_vars({"TEST_A": ""})
+
+
+def test_bool_conversion() -> None:
+    @envwrap("TEST_")
+    def test_func(  # type: ignore[no-untyped-def]
+        a: bool = True, b=True, c: bytes = b""
+    ) -> Tuple[Any, Any, Any]:
+        return a, b, c
+
+    set_env_vars({"TEST_A": "False", "TEST_B": "0", "TEST_C": "raw"})
+    assert test_func() == (False, False, b"raw")
+    set_env_vars({"TEST_A": "yes", "TEST_B": "On"})
+    assert test_func() == (True, True, b"raw")
+    clear_env_vars({"TEST_A": "", "TEST_B": "", "TEST_C": ""})
+
+
+def test_string_annotations() -> None:
+    @envwrap("TEST_")
+    def test_func(
+        a: "int" = None,  # type: ignore[assignment]
+        b: "Union[int, None]" = None,
+        c: "Missing" = 2.0,  # type: ignore[name-defined]  # noqa: F821
+    ) -> Tuple[Any, Any, Any]:
+        return a, b, c
+
+    # `a` and `b` have no default-type fallback, so they only convert if resolved
+    set_env_vars({"TEST_A": "42", "TEST_B": "7", "TEST_C": "3.5"})
+    assert test_func() == (42, 7, 3.5)
+    clear_env_vars({"TEST_A": "", "TEST_B": "", "TEST_C": ""})
+
+
+def test_class_body_annotations_ignored() -> None:
+    class Handler:
+        retries: str
+
+        def __call__(self, retries: int = 3) -> int:
+            return retries
+
+    class Config:
+        port: str
+
+        def __init__(self, port: "int" = None) -> None:  # type: ignore[assignment]
+            self.port = port  # type: ignore[assignment]
+
+    handler = envwrap("TEST_")(Handler())
+    config = envwrap("TEST_")(Config)
+
+    set_env_vars({"TEST_RETRIES": "5", "TEST_PORT": "8080"})
+    assert handler() == 5
+    assert vars(config())["port"] == 8080
+    clear_env_vars({"TEST_RETRIES": "", "TEST_PORT": ""})
+
+
+def test_union_type_conversion() -> None:
+    @envwrap("TEST_")
+    def test_func(a: Union[int, str] = 1, b: int = 2) -> Tuple[Any, Any]:
+        return a, b
+
+    set_env_vars({"TEST_A": "42", "TEST_B": "not_an_int"})
+    assert test_func() == (42, "not_an_int")
+    set_env_vars({"TEST_A": "forty-two"})
+    assert test_func() == ("forty-two", "not_an_int")
+    clear_env_vars({"TEST_A": "", "TEST_B": ""})
+
+
+def test_unusual_prefix() -> None:
+    @envwrap('TEST_"\\_')
+    def test_func(a: int = 1) -> int:
+        return a
+
+    set_env_vars({'TEST_"\\_A': "7"})
+    assert test_func() == 7
+    clear_env_vars({'TEST_"\\_A': ""})
+
+
+def test_not_callable() -> None:
+    with pytest.raises(TypeError):
+        envwrap("TEST_")(42)  # type: ignore[arg-type]
+
+
 # Run the tests
 if __name__ == "__main__":
     pytest.main([__file__])